@@ -25,16 +25,21 @@ NOTE:
 import os
 import re
 import csv
+import json
 import time
+import random
+import sqlite3
 import datetime
+import orjson
 import requests
 from dotenv import load_dotenv
 load_dotenv()
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from requests.adapters import HTTPAdapter, Retry
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth1
 from tqdm import tqdm
-from threading import Lock
+from queue import Queue
+from threading import Condition, Event, Lock, local
 
 
 # ============================================================
@@ -103,50 +108,166 @@ DOCKET_TOKEN_RE = re.compile(
     re.VERBOSE | re.IGNORECASE,
 )
 
+# Template braces and "| name =" field starts, walked by infobox_fields()
+FIELD_RE = re.compile(r"\{\{|\}\}|\|\s*(\w+)\s*=")
+DIGITS_RE = re.compile(r"[0-9]+")
+
+# Markup stripped by clean_markup(): external links and tags are dropped,
+# wikilinks are replaced by their label. One alternation so the box is
+# scanned once.
+CLEAN_RE = re.compile(
+    r"\[https?://[^\]\s]*(?:\s+[^\]]+)?\]"
+    r"|\[\[(?:[^\]|]+\|)?(?P<link>[^\]]+)\]\]"
+    r"|<.*?>"
+)
+TAG_RE = re.compile(r"<.*?>")
+
 # ============================================================
 # Rate limiting
 # ============================================================
 
-rate_lock = Lock()
-delay = 0.03
+class TokenBucket:
+    """
+    Token-bucket limiter shared by all worker threads.
+
+    Tokens refill continuously at `rate` per second, up to `capacity`, so
+    a burst of requests goes out immediately and callers only block once
+    the bucket is empty. The rate adapts AIMD-style: halved when the API
+    returns 429, raised by a fixed step at most once per second while
+    requests succeed.
+    """
+
+    def __init__(self, rate, capacity, min_rate=1.0):
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.last_increase = self.updated
+        self.cond = Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+
+    def acquire(self):
+        with self.cond:
+            self._refill()
+            while self.tokens < 1:
+                self.cond.wait((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+    def multiplicative_decrease(self, factor):
+        with self.cond:
+            self._refill()
+            self.rate = max(self.rate * factor, self.min_rate)
+            # Drop any saved-up burst so the slowdown takes effect now
+            self.tokens = 0
+
+    def additive_increase(self, step):
+        with self.cond:
+            self._refill()
+            if self.updated - self.last_increase >= 1.0:
+                self.rate = min(self.rate + step, self.max_rate)
+                self.last_increase = self.updated
+
+
+bucket = TokenBucket(rate=50, capacity=50)
 
-def throttle():
-    with rate_lock:
-        time.sleep(delay)
 
 def adjust_rate(error=False):
-    global delay
-    with rate_lock:
-        if error:
-            delay = min(delay * 2, 1.0)
-        else:
-            delay = max(delay * 0.95, 0.02)
+    if error:
+        bucket.multiplicative_decrease(0.5)
+    else:
+        bucket.additive_increase(1)
 
 # ============================================================
-# HTTP session with retries
+# HTTP sessions with retries
 # ============================================================
 
-session = requests.Session()
-session.auth = auth
+# Each worker thread gets its own Session: requests doesn't promise that a
+# Session is safe to share between threads, and separate sessions keep
+# the threads from contending on one urllib3 connection pool. A thread
+# only has one request in flight, so its pools stay small; keep-alive
+# still reuses connections across that thread's requests.
+POOL_SIZE = 4
 
-retries = Retry(
-    total=5,
-    backoff_factor=0.2,
-    status_forcelist=[429, 500, 502, 503, 504],
-)
-session.mount("https://", HTTPAdapter(max_retries=retries))
+_thread_local = local()
+
+
+def get_session():
+    s = getattr(_thread_local, "session", None)
+    if s is None:
+        s = requests.Session()
+        s.auth = auth
+        # No urllib3-level retries: get_with_retries() owns them
+        s.mount("https://", HTTPAdapter(pool_maxsize=POOL_SIZE))
+        _thread_local.session = s
+    return s
+
+
+MAX_ATTEMPTS = 6
+
+# Longest Retry-After we honor; a server asking for more gets this instead
+RETRY_AFTER_MAX = 30.0
+
+
+def retry_after(r, default):
+    """Seconds the server asked us to wait, clamped to [0.1, RETRY_AFTER_MAX]."""
+    try:
+        wait = float(r.headers.get("Retry-After", default))
+    except ValueError:
+        # HTTP-date form; not worth parsing
+        wait = default
+    return min(max(wait, 0.1), RETRY_AFTER_MAX)
+
+
+def get_with_retries(url, params=None, timeout=25):
+    """
+    GET `url`, retrying 429s, 5xx and dropped or timed-out connections.
+
+    Retried here rather than by urllib3: each attempt waits for the token
+    bucket and goes out as a new request, so OAuth1 signs it with a fresh
+    nonce and timestamp instead of replaying the first one. Returns the
+    last response once attempts run out; a connection error on the last
+    attempt is raised.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        last = attempt == MAX_ATTEMPTS - 1
+        bucket.acquire()
+        try:
+            r = get_session().get(
+                url, params=params, headers=HEADERS, timeout=timeout
+            )
+        except (requests.ConnectionError, requests.Timeout):
+            if last:
+                raise
+            r = None
+
+        if r is not None and r.status_code == 429:
+            adjust_rate(error=True)
+            wait = retry_after(r, default=2 ** attempt)
+        elif r is None or r.status_code >= 500:
+            # Exponential backoff with jitter so workers don't retry in step
+            wait = min(30, 2 ** attempt) + random.random()
+        else:
+            adjust_rate(error=False)
+            return r
+
+        if last:
+            return r
+        time.sleep(wait)
 
 
 def safe_get(params):
-    throttle()
-    r = session.get(API_URL, params=params, headers=HEADERS, timeout=25)
-    if r.status_code == 429:
-        adjust_rate(error=True)
-        time.sleep(delay)
-        return safe_get(params)
-    adjust_rate(error=False)
+    r = get_with_retries(API_URL, params=params, timeout=25)
     r.raise_for_status()
-    return r.json()
+    return orjson.loads(r.content)
 
 
 # ============================================================
@@ -154,7 +275,8 @@ def safe_get(params):
 # ============================================================
 
 def get_pages_with_infobox():
-    pages = set()
+    """Yield page titles as each continuation of the listing arrives."""
+    seen = set()
     templates = [
         "Template:Infobox_US_Supreme_Court_case",
     ]
@@ -172,21 +294,20 @@ def get_pages_with_infobox():
         while True:
             data = safe_get(params)
             for p in data.get("query", {}).get("embeddedin", []):
-                pages.add(p["title"])
+                if p["title"] not in seen:
+                    seen.add(p["title"])
+                    yield p["title"]
 
             if "continue" not in data:
                 break
             params.update(data["continue"])
 
-    return sorted(pages)
-
 
 # ============================================================
 # Wikitext retrieval & parsing
 # ============================================================
 
 def get_wikitext_batch(titles):
-    throttle()
     params = {
         "action": "query",
         "prop": "revisions",
@@ -209,45 +330,93 @@ def extract_infobox(text):
     if not m:
         return ""
     start = m.start()
-    depth = 0
-    i = start
-
-    while i < len(text):
-        if text[i:i+2] == "{{":
+    depth = 1
+    i = start + 2
+
+    # Jump between brace tokens with str.find instead of stepping through
+    # the text one character at a time.
+    while True:
+        nxt_open = text.find("{{", i)
+        nxt_close = text.find("}}", i)
+        if nxt_close == -1:
+            break
+
+        if nxt_open != -1 and nxt_open < nxt_close:
             depth += 1
-            i += 2
-        elif text[i:i+2] == "}}":
+            i = nxt_open + 2
+        else:
             depth -= 1
-            i += 2
-            if depth <= 0:
+            i = nxt_close + 2
+            if depth == 0:
                 return text[start:i]
-        else:
-            i += 1
 
     return ""
 
 
 def clean_markup(t):
-    t = re.sub(r"\[https?://[^\]\s]*(?:\s+[^\]]+)?\]", "", t)
-    t = re.sub(r"\[\[([^\]|]+\|)?([^\]]+)\]\]", r"\2", t)
-    t = re.sub(r"<.*?>", "", t)
-    return t
+    return CLEAN_RE.sub(_clean_repl, t)
+
+
+def _clean_repl(m):
+    label = m.group("link")
+    if label is None:
+        return ""
+    # Tags inside a link label, e.g. [[Roe v. Wade|<i>Roe</i>]]
+    if "<" in label:
+        label = TAG_RE.sub("", label)
+    return label
+
+
+def infobox_fields(box):
+    """
+    Split an infobox into {lowercased field name: value} in one pass.
+
+    Only "| name =" at the infobox's own brace depth starts a field, so
+    fields sharing a line are split apart while parameters of nested
+    templates stay inside their value. A value runs up to the next field
+    or the closing "}}"; if a field repeats, the first occurrence wins.
+    """
+    fields = {}
+    depth = 0
+    name = None
+    start = 0
+
+    for m in FIELD_RE.finditer(box):
+        tok = m.group(0)
+        if tok == "{{":
+            depth += 1
+            continue
+        if tok == "}}":
+            depth -= 1
+            if depth > 0:
+                continue
+        elif depth != 1:
+            continue
+
+        if name is not None:
+            fields.setdefault(name, box[start:m.start()].strip())
+        if depth <= 0:
+            name = None
+            break
+        name = m.group(1).lower()
+        start = m.end()
+
+    if name is not None:
+        fields.setdefault(name, box[start:].strip())
+
+    return fields
 
 
 def extract_us_cite_and_docket(box):
     us = ""
     docket = ""
 
-    box_clean = clean_markup(box)
+    fields = infobox_fields(clean_markup(box))
 
     # Citations field
-    cit = re.search(
-        r"\|\s*[Cc]itations\s*=\s*((?:.|\n)*?)(?=\n\|\s*\w+\s*=|\n\}\}|$)",
-        box_clean,
-    )
+    field = fields.get("citations")
 
-    if cit:
-        field = cit.group(1)
+    if field:
         m_us = US_CITE_RE.search(field)
         if m_us:
             us = m_us.group(0)
@@ -258,19 +427,17 @@ def extract_us_cite_and_docket(box):
 
     # USVol + USPage
     if not us:
-        v = re.search(r"\|\s*[Uu][Ss][Vv]ol\s*=\s*([0-9]+)", box_clean)
-        p = re.search(r"\|\s*[Uu][Ss][Pp]age\s*=\s*([0-9]+)", box_clean)
+        v = DIGITS_RE.match(fields.get("usvol", ""))
+        p = DIGITS_RE.match(fields.get("uspage", ""))
         if v and p:
-            us = f"{v.group(1)} U.S. {p.group(1)}"
+            us = f"{v.group(0)} U.S. {p.group(0)}"
 
-    # Docket field
+    # Docket field (first line only)
     if not docket:
-        m_line = re.search(r"\|\s*[Dd]ocket\s*=\s*([^\n]+)", box_clean)
-        if m_line:
-            rhs = m_line.group(1)
-            m_dk = DOCKET_TOKEN_RE.search(rhs)
-            if m_dk:
-                docket = m_dk.group(1)
+        rhs = fields.get("docket", "").split("\n", 1)[0]
+        m_dk = DOCKET_TOKEN_RE.search(rhs)
+        if m_dk:
+            docket = m_dk.group(1)
 
     docket = docket.replace("–", "-").replace("—", "-")
     return us.strip(), docket.strip()
@@ -280,54 +447,131 @@ def extract_us_cite_and_docket(box):
 # Pageview retrieval
 # ============================================================
 
-def get_pageviews(title):
-    throttle()
-    base = (
-        "https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article/"
-        "en.wikipedia/all-access/user"
-    )
+PAGEVIEW_BASE = (
+    "https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article/"
+    "en.wikipedia/all-access/user"
+)
 
+PAGEVIEW_CACHE_FILE = ".pageview_cache.sqlite"
+
+
+class PageviewCache:
+    """
+    Monthly pageview series per title, kept in SQLite across runs.
+
+    A series is current once it holds the last complete calendar month;
+    later runs only fetch the months added since. Each entry also records
+    the month it was last refreshed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = None
+        self.lock = Lock()
+
+    def _connect(self):
+        # Opened on first use so importing this module doesn't touch the
+        # file.
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS pageviews ("
+                "title TEXT PRIMARY KEY, updated TEXT NOT NULL, "
+                "monthly TEXT NOT NULL)"
+            )
+        return self.conn
+
+    def get(self, title):
+        """Return (updated YYYYMM or None, [[timestamp, views], ...])."""
+        with self.lock:
+            row = self._connect().execute(
+                "SELECT updated, monthly FROM pageviews WHERE title = ?",
+                (title,),
+            ).fetchone()
+        if row is None:
+            return None, []
+        return row[0], orjson.loads(row[1])
+
+    def put(self, title, updated, monthly):
+        with self.lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO pageviews VALUES (?, ?, ?)",
+                (title, updated, orjson.dumps(monthly)),
+            )
+            conn.commit()
+
+
+pageview_cache = PageviewCache(PAGEVIEW_CACHE_FILE)
+
+
+def fetch_monthly_views(title, start):
+    """
+    Fetch [[timestamp, views], ...] from `start` (YYYYMMDD) to today, or
+    None if the request failed.
+    """
     t = title.replace(" ", "_")
-    start = "20080101"
     end = datetime.date.today().strftime("%Y%m%d")
 
-    url = f"{base}/{t}/monthly/{start}/{end}"
+    url = f"{PAGEVIEW_BASE}/{t}/monthly/{start}/{end}"
 
     try:
-        r = session.get(url, headers=HEADERS, timeout=20)
-        if r.status_code == 429:
-            adjust_rate(error=True)
-            time.sleep(delay)
-            return (0, 0, 0, 0)
-
-        adjust_rate(error=False)
+        r = get_with_retries(url, timeout=20)
 
+        # 404 means no views recorded in the range
+        if r.status_code == 404:
+            return []
         if r.status_code != 200:
-            return (0, 0, 0, 0)
-
-        items = r.json().get("items", [])
-        if not items:
-            return (0, 0, 0, 0)
+            return None
 
-        views = [x["views"] for x in items]
+        items = orjson.loads(r.content).get("items", [])
+        return [[x["timestamp"], x["views"]] for x in items]
 
-        all_time = sum(views)
-        last_12 = sum(views[-12:]) if len(views) >= 12 else sum(views)
-        last_6 = sum(views[-6:]) if len(views) >= 6 else sum(views)
-        last_1 = views[-1] if views else 0
+    except Exception:
+        return None
 
-        return (all_time, last_12, last_6, last_1)
 
-    except Exception:
+def get_pageviews(title):
+    today = datetime.date.today()
+    this_month = today.strftime("%Y%m")
+    last_month = (
+        today.replace(day=1) - datetime.timedelta(days=1)
+    ).strftime("%Y%m")
+    _, monthly = pageview_cache.get(title)
+
+    # Judge freshness by the newest cached month rather than the refresh
+    # date: early in a month the API may not have published the month
+    # before yet, and a refresh then must not count as current.
+    if not monthly or monthly[-1][0][:6] != last_month:
+        # Refetch from the last cached month on, in case it was partial
+        start = monthly[-1][0][:8] if monthly else "20080101"
+        new = fetch_monthly_views(title, start)
+        if new is not None:
+            merged = dict(monthly)
+            merged.update(new)
+            monthly = sorted(merged.items())
+            pageview_cache.put(title, this_month, monthly)
+
+    # A failed refresh falls back to whatever is cached
+    if not monthly:
         return (0, 0, 0, 0)
 
+    views = [v for _, v in monthly]
+
+    all_time = sum(views)
+    last_12 = sum(views[-12:]) if len(views) >= 12 else sum(views)
+    last_6 = sum(views[-6:]) if len(views) >= 6 else sum(views)
+    last_1 = views[-1] if views else 0
+
+    return (all_time, last_12, last_6, last_1)
+
 
 # ============================================================
 # Batch processing
 # ============================================================
 
-def process_batch(titles):
-    data = get_wikitext_batch(titles)
+def parse_batch(titles, data):
+    """Extract (title, usCite, docket) rows from one batch of wikitext."""
     rows = []
 
     for t in titles:
@@ -344,65 +588,206 @@ def process_batch(titles):
     return rows
 
 
+def fetch_batch(titles):
+    """
+    Fetch and parse one batch on the calling pool thread. Parsing a
+    50-page batch takes a few milliseconds, less than shipping it to a
+    worker process and back would.
+    """
+    return parse_batch(titles, get_wikitext_batch(titles))
+
+
+BATCH_SIZE = 50
+
+# Listing, wikitext and pageview requests all share one thread pool. They
+# spend nearly all of their time waiting on the network; the token bucket,
+# not the thread count, sets the request rate.
+HTTP_WORKERS = 32
+
+
+# Pageview rows handled per pool task, so the pipeline tracks one future
+# per chunk rather than one per title.
+PAGEVIEW_CHUNK = 16
+
+
+def pageview_rows(rows):
+    """Attach pageview counts to each (title, usCite, docket) row."""
+    return [[t, us, dock, *get_pageviews(t)] for (t, us, dock) in rows]
+
+
+def list_batches(skip, emit, stop):
+    """
+    Pass `emit` batches of listed titles, leaving out those in `skip`.
+    Listing ends early once `stop` is set.
+    """
+    batch = []
+    for title in get_pages_with_infobox():
+        if stop.is_set():
+            return
+        if title in skip:
+            continue
+        batch.append(title)
+        if len(batch) == BATCH_SIZE:
+            emit(batch)
+            batch = []
+    if batch:
+        emit(batch)
+
+
+def run_pipeline(saved_rows, written, checkpoint, w, f):
+    """
+    Run listing -> wikitext -> pageviews as overlapping stages.
+
+    Titles are batched for wikitext as soon as each listing continuation
+    arrives, each batch is parsed by the thread that fetched it, and each
+    parsed row's pageviews are requested right away. All stages share one
+    thread pool; this thread only routes finished work to the next stage,
+    so it alone writes the `checkpoint` and CSV writer `w`.
+
+    `saved_rows` come from an interrupted run's checkpoint and go straight
+    to the pageview stage; titles in `written` are already in the CSV.
+    Returns the number of rows written.
+    """
+    events = Queue()
+
+    def track(fut, stage):
+        fut.add_done_callback(lambda fut: events.put((stage, None, fut)))
+
+    with ThreadPoolExecutor(max_workers=HTTP_WORKERS) as pool, tqdm(
+        total=0, desc="Wikitext", position=0
+    ) as wt_bar, tqdm(
+        total=0, desc="Pageviews", position=1
+    ) as pv_bar:
+
+        def submit_pageviews(rows):
+            rows = [row for row in rows if row[0] not in written]
+            chunks = [
+                rows[i:i+PAGEVIEW_CHUNK]
+                for i in range(0, len(rows), PAGEVIEW_CHUNK)
+            ]
+            for chunk in chunks:
+                track(pool.submit(pageview_rows, chunk), "views")
+            pv_bar.total += len(rows)
+            pv_bar.refresh()
+            return len(chunks)
+
+        done = {row[0] for row in saved_rows}
+        stop = Event()
+        track(
+            pool.submit(
+                list_batches, done, lambda b: events.put(("batch", b, None)), stop
+            ),
+            "listing",
+        )
+        outstanding = 1 + submit_pageviews(saved_rows)
+
+        try:
+            while outstanding:
+                stage, payload, fut = events.get()
+
+                if stage == "batch":
+                    track(pool.submit(fetch_batch, payload), "fetch")
+                    outstanding += 1
+                    wt_bar.total += 1
+                    wt_bar.refresh()
+                    continue
+
+                outstanding -= 1
+                result = fut.result()
+
+                if stage == "fetch":
+                    for row in result:
+                        checkpoint.write(json.dumps(row) + "\n")
+                    checkpoint.flush()
+                    wt_bar.update(1)
+                    outstanding += submit_pageviews(result)
+                elif stage == "views":
+                    w.writerows(result)
+                    f.flush()
+                    pv_bar.update(len(result))
+        except BaseException:
+            # A failed stage or Ctrl-C: drop the queued work instead of
+            # letting the pool run it out on exit. Everything finished is
+            # already in the checkpoint and CSV, so the next run resumes.
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    return pv_bar.n
+
+
+# ============================================================
+# Checkpointing
+# ============================================================
+
+OUTPUT_FILE = "wiki_infobox_cases.csv"
+
+# Wikitext rows from the current run. The file only exists while a run is
+# in progress, so finding it at startup means the last run was
+# interrupted and should be resumed rather than started over.
+CHECKPOINT_FILE = "wiki_infobox_rows.jsonl"
+
+
+def load_checkpoint(path):
+    if not os.path.exists(path):
+        return []
+
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rows.append(tuple(json.loads(line)))
+            except json.JSONDecodeError:
+                # Line cut short by the crash
+                continue
+    return rows
+
+
+def load_written_titles(path):
+    if not os.path.exists(path):
+        return set()
+
+    with open(path, encoding="utf-8", newline="") as f:
+        return {row["title"] for row in csv.DictReader(f)}
+
+
 # ============================================================
 # Main workflow
 # ============================================================
 
 def main():
-    print("Fetching list of pages with SCOTUS infobox...")
-    pages = get_pages_with_infobox()
-    print(f"Found {len(pages)} pages.\n")
-
-    batches = [pages[i:i+50] for i in range(0, len(pages), 50)]
-
-    all_rows = []
-
-    print("Fetching wikitext and extracting cites/dockets...")
-    with ThreadPoolExecutor(max_workers=10) as pool, tqdm(
-        total=len(batches), desc="Wikitext"
-    ) as bar:
-        futures = [pool.submit(process_batch, b) for b in batches]
-        for fut in as_completed(futures):
-            rows = fut.result()
-            all_rows.extend(rows)
-            bar.update(1)
-
-    print(f"\nTotal rows collected: {len(all_rows)}\n")
-
-    print("Fetching pageviews...")
-    final_rows = []
-    with ThreadPoolExecutor(max_workers=20) as pool, tqdm(
-        total=len(all_rows), desc="Pageviews"
-    ) as bar:
-        future_map = {
-            pool.submit(get_pageviews, t): (t, us, dock)
-            for (t, us, dock) in all_rows
-        }
-
-        for fut in as_completed(future_map):
-            t, us, dock = future_map[fut]
-            v_all, v_yr, v_6, v_1 = fut.result()
-            final_rows.append([
-                t, us, dock,
-                v_all, v_yr, v_6, v_1
+    resuming = os.path.exists(CHECKPOINT_FILE)
+
+    saved_rows = load_checkpoint(CHECKPOINT_FILE)
+    written = load_written_titles(OUTPUT_FILE) if resuming else set()
+    if resuming:
+        print(
+            f"Resuming: {len(saved_rows)} rows in {CHECKPOINT_FILE}, "
+            f"{len(written)} already in {OUTPUT_FILE}"
+        )
+
+    print("Fetching pages with SCOTUS infobox, their wikitext and pageviews...")
+    with open(CHECKPOINT_FILE, "a", encoding="utf-8") as ckpt, open(
+        OUTPUT_FILE, "a" if written else "w", encoding="utf-8", newline=""
+    ) as f:
+        w = csv.writer(f)
+        if not written:
+            w.writerow([
+                "title",
+                "usCite",
+                "docket",
+                "views_all_time",
+                "views_1yr",
+                "views_6mo",
+                "views_1mo",
             ])
-            bar.update(1)
+        n_new = run_pipeline(saved_rows, written, ckpt, w, f)
 
-    with open("wiki_infobox_cases.csv", "w", encoding="utf-8", newline="") as f:
-        w = csv.writer(f)
-        w.writerow([
-            "title",
-            "usCite",
-            "docket",
-            "views_all_time",
-            "views_1yr",
-            "views_6mo",
-            "views_1mo",
-        ])
-        w.writerows(final_rows)
+    # Finished cleanly; the next run starts from scratch
+    os.remove(CHECKPOINT_FILE)
 
     print("\n=== DONE ===")
-    print("wiki_infobox_cases.csv rows:", len(final_rows))
+    print(f"{OUTPUT_FILE} rows:", len(written) + n_new)
 
 
 if __name__ == "__main__":
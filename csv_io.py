@@ -0,0 +1,29 @@
+"""
+csv_io.py
+-----------------
+
+CSV reading shared by merge_scdb.py and extract.py.
+"""
+
+import csv
+
+import pyarrow as pa
+import pyarrow.csv as pv
+
+
+def read_csv_as_strings(path: str, encoding: str) -> pa.Table:
+    """Read a CSV with every column kept as a string, like dtype=str."""
+    # pyarrow drops a UTF-8 BOM from the first column name, so the header
+    # has to be read the same way for the names to match
+    header_encoding = "utf-8-sig" if encoding == "utf-8" else encoding
+    with open(path, encoding=header_encoding, newline="") as f:
+        header = next(csv.reader(f))
+
+    return pv.read_csv(
+        path,
+        read_options=pv.ReadOptions(encoding=encoding),
+        convert_options=pv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            strings_can_be_null=True,
+        ),
+    )
@@ -1,36 +1,40 @@
 import pandas as pd
 import re
 
+from csv_io import read_csv_as_strings
+
 WIKI_FILE = "wiki_infobox_cases.csv"
 SCDB_FILE = "SCDB_merged.csv"
 OUTPUT_FILE = "SCDB_with_infobox_views.csv"
 UNMATCHED_FILE = "unmatched_wiki_cases.csv"
 
 
-def norm_us(s: str) -> str:
+def norm_us(s: pd.Series) -> pd.Series:
     """Normalize U.S. citations for matching."""
-    if not isinstance(s, str):
-        return ""
-    s = s.strip()
-    # Normalize U. S. vs U.S.
-    s = s.replace("U. S.", "U.S.").replace("U. S", "U.S")
-    s = s.replace("U. S", "U.S")
-    # Normalize dashes
-    s = s.replace("–", "-").replace("—", "-")
-    # Collapse internal whitespace
-    s = " ".join(s.split())
-    return s
-
-
-def norm_docket(s: str) -> str:
+    return (
+        s.str.strip()
+        # Normalize U. S. vs U.S.
+        .str.replace("U. S.", "U.S.", regex=False)
+        .str.replace("U. S", "U.S", regex=False)
+        # Normalize dashes
+        .str.replace("–", "-", regex=False)
+        .str.replace("—", "-", regex=False)
+        # Collapse internal whitespace
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def norm_docket(s: pd.Series) -> pd.Series:
     """Normalize docket strings for matching."""
-    if not isinstance(s, str):
-        return ""
-    s = s.strip()
-    s = s.replace("–", "-").replace("—", "-")
-    # Strip "No." prefixes but preserve letters and hyphens
-    s = s.replace("No. ", "").replace("No.", "")
-    return s
+    return (
+        s.str.strip()
+        .str.replace("–", "-", regex=False)
+        .str.replace("—", "-", regex=False)
+        # Strip "No." prefixes but preserve letters and hyphens
+        .str.replace("No. ", "", regex=False)
+        .str.replace("No.", "", regex=False)
+    )
 
 
 # Placeholder U.S. citations:
@@ -62,7 +66,7 @@ def is_placeholder_us(us_norm: str) -> bool:
     return bool(PLACEHOLDER_US_RE.match(us_norm))
 
 
-def get_wiki_year(row: pd.Series):
+def get_wiki_years(wiki: pd.DataFrame) -> pd.Series:
     """
     Get a decision year from wiki metadata, used only to disambiguate
     when a docket maps to multiple SCDB rows.
@@ -71,141 +75,104 @@ def get_wiki_year(row: pd.Series):
         1. Year in the title at the end: '... (2018)'
         2. Year in the raw usCite string: '524 U.S. 274 (1998)'
     """
-    title = str(row.get("title", "") or "")
-    m = re.search(r"\((\d{4})\)\s*$", title)
-    if m:
-        return int(m.group(1))
-
-    us_raw = str(row.get("usCite", "") or "")
-    m2 = re.search(r"(1[89]\d{2}|20\d{2})", us_raw)
-    if m2:
-        return int(m2.group(1))
+    from_title = wiki["title"].str.extract(r"\((\d{4})\)\s*$", expand=False)
+    from_us = wiki["usCite"].str.extract(r"(1[89]\d{2}|20\d{2})", expand=False)
+    return pd.to_numeric(from_title.fillna(from_us)).astype("Int64")
 
-    return None
 
-
-def compute_decision_year(date_decision: str, term: str):
+def compute_decision_year(scdb: pd.DataFrame) -> pd.Series:
     """
     Compute a year for SCDB rows, preferring dateDecision, falling
     back to term if necessary.
     """
-    dd = str(date_decision or "").strip()
-    if dd:
-        parts = dd.split("/")
-        y = parts[-1]
-        if len(y) == 4 and y.isdigit():
-            return int(y)
-
-    t = str(term or "").strip()
-    if t.isdigit():
-        return int(t)
-
-    return None
+    # Year is the last "/"-separated part of dateDecision, e.g. 6/26/2015
+    from_date = scdb["dateDecision"].str.extract(r"(?:^\s*|/)(\d{4})\s*$", expand=False)
+    return pd.to_numeric(from_date.fillna(scdb["term"]), errors="coerce")
 
 
 def main():
     # Load wiki infobox data — includes ALL infobox pages, even with blank usCite/docket.
-    wiki = pd.read_csv(WIKI_FILE, dtype=str).fillna("")
-    scdb = pd.read_csv(SCDB_FILE, dtype=str).fillna("")
+    # Every SCDB column is carried into the output, so nothing is pruned.
+    # Read through pyarrow.csv with string column types: pandas'
+    # engine="pyarrow" infers types first and turns "04" into "4".
+    wiki = read_csv_as_strings(WIKI_FILE, "utf-8").to_pandas().fillna("")
+    scdb = read_csv_as_strings(SCDB_FILE, "utf-8").to_pandas().fillna("")
 
     # Normalize for matching
-    wiki["usCite_norm"] = wiki["usCite"].apply(norm_us)
-    wiki["docket_norm"] = wiki["docket"].apply(norm_docket)
+    wiki["usCite_norm"] = norm_us(wiki["usCite"])
+    wiki["docket_norm"] = norm_docket(wiki["docket"])
 
-    scdb["usCite_norm"] = scdb["usCite"].apply(norm_us)
-    scdb["docket_norm"] = scdb["docket"].apply(norm_docket)
+    scdb["usCite_norm"] = norm_us(scdb["usCite"])
+    scdb["docket_norm"] = norm_docket(scdb["docket"])
 
     # Precompute decision year for SCDB, for docket-based disambiguation
-    scdb["decisionYear"] = scdb.apply(
-        lambda r: compute_decision_year(
-            r.get("dateDecision", ""), r.get("term", "")
-        ),
-        axis=1,
+    scdb["decisionYear"] = compute_decision_year(scdb)
+
+    # Join keys only; the chosen SCDB rows are pulled in by position at
+    # the end so the full SCDB frame is never copied through a merge.
+    keys = pd.DataFrame(
+        {
+            # Treat placeholders and blanks as "no usCite" for matching
+            "us_key": wiki["usCite_norm"].where(
+                ~wiki["usCite_norm"].map(is_placeholder_us), ""
+            ),
+            "docket_norm": wiki["docket_norm"],
+            "wiki_year": get_wiki_years(wiki),
+        }
     )
-
-    # Index SCDB by usCite_norm and docket_norm
-    scdb_by_us = {}
-    for k, grp in scdb.groupby("usCite_norm"):
-        if k:
-            scdb_by_us[k] = grp
-
-    scdb_by_docket = {}
-    for k, grp in scdb.groupby("docket_norm"):
-        if k:
-            scdb_by_docket[k] = grp
-
-    matched_rows = []
-    unmatched_rows = []
-
-    for _, w_row in wiki.iterrows():
-        w_title = w_row["title"]
-        w_us_norm = w_row["usCite_norm"]
-        w_docket_norm = w_row["docket_norm"]
-
-        # Treat placeholders and blanks as "no usCite" for matching
-        if is_placeholder_us(w_us_norm):
-            w_us_effective = ""
-        else:
-            w_us_effective = w_us_norm
-
-        chosen = None
-
-        # --- 1) Try usCite first (if non-blank and non-placeholder) --------
-        if w_us_effective and w_us_effective in scdb_by_us:
-            cand = scdb_by_us[w_us_effective]
-            if len(cand) == 1:
-                chosen = cand.iloc[0]
-            else:
-                # In practice US reports cites are unique; if not,
-                # take the first row deterministically.
-                chosen = cand.iloc[0]
-
-        # --- 2) If no usCite match, try docket -----------------------------
-        if chosen is None and w_docket_norm:
-            if w_docket_norm in scdb_by_docket:
-                cand = scdb_by_docket[w_docket_norm]
-
-                if len(cand) == 1:
-                    chosen = cand.iloc[0]
-                else:
-                    # Only here do we invoke year-based disambiguation:
-                    # a docket maps to multiple SCDB decisions.
-                    wiki_year = get_wiki_year(w_row)
-                    if wiki_year is not None:
-                        cand_year = cand[cand["decisionYear"] == wiki_year]
-                        if len(cand_year) == 1:
-                            chosen = cand_year.iloc[0]
-                        elif len(cand_year) > 1:
-                            # Still ambiguous, but at least filtered by year
-                            chosen = cand_year.iloc[0]
-                        else:
-                            # No exact year match; fall back to first
-                            chosen = cand.iloc[0]
-                    else:
-                        # No wiki year info; fall back to first SCDB row
-                        chosen = cand.iloc[0]
-
-        # --- 3) Record matched vs unmatched -------------------------------
-        if chosen is None:
-            unmatched_rows.append(w_row.to_dict())
-        else:
-            merged = chosen.to_dict()
-            # Attach wiki metadata + views
-            merged.update(
-                {
-                    "wiki_title": w_title,
-                    "wiki_usCite": w_row["usCite"],
-                    "wiki_docket": w_row["docket"],
-                    "views_all_time": w_row["views_all_time"],
-                    "views_1yr": w_row["views_1yr"],
-                    "views_6mo": w_row["views_6mo"],
-                    "views_1mo": w_row["views_1mo"],
-                }
-            )
-            matched_rows.append(merged)
-
-    matched_df = pd.DataFrame(matched_rows)
-    unmatched_df = pd.DataFrame(unmatched_rows)
+    scdb_keys = pd.DataFrame(
+        {
+            "usCite_norm": scdb["usCite_norm"],
+            "docket_norm": scdb["docket_norm"],
+            "year": pd.to_numeric(scdb["decisionYear"]).astype("Int64"),
+            "scdb_row": range(len(scdb)),
+        }
+    )
+    has_us = scdb_keys["usCite_norm"] != ""
+    has_docket = scdb_keys["docket_norm"] != ""
+
+    # --- 1) Try usCite first (if non-blank and non-placeholder) ------------
+    # In practice US reports cites are unique; if not, take the first row
+    # deterministically.
+    by_us = scdb_keys[has_us].drop_duplicates("usCite_norm", keep="first")
+    us_index = dict(zip(by_us["usCite_norm"], by_us["scdb_row"]))
+    us_match = keys["us_key"].map(us_index)
+
+    # --- 2) If no usCite match, try docket ---------------------------------
+    by_docket = scdb_keys[has_docket].drop_duplicates("docket_norm", keep="first")
+    docket_index = dict(zip(by_docket["docket_norm"], by_docket["scdb_row"]))
+    docket_match = keys["docket_norm"].map(docket_index)
+
+    # Only dockets that map to multiple SCDB decisions need year-based
+    # disambiguation: prefer the first one decided in the wiki year, else
+    # (no year info, or no row for that year) keep the first row above.
+    ambiguous = has_docket & scdb_keys["docket_norm"].duplicated(keep=False)
+    by_docket_year = (
+        scdb_keys.loc[ambiguous, ["docket_norm", "year", "scdb_row"]]
+        .dropna(subset=["year"])
+        .drop_duplicates(["docket_norm", "year"], keep="first")
+    )
+    docket_year_match = keys.merge(
+        by_docket_year,
+        how="left",
+        left_on=["docket_norm", "wiki_year"],
+        right_on=["docket_norm", "year"],
+    )["scdb_row"]
+
+    chosen = us_match.fillna(docket_year_match).fillna(docket_match)
+    is_matched = chosen.notna().to_numpy()
+
+    # --- 3) Record matched vs unmatched -----------------------------------
+    matched_wiki = wiki[is_matched].reset_index(drop=True)
+    matched_df = scdb.iloc[chosen[is_matched].astype(int)].reset_index(drop=True)
+    # Attach wiki metadata + views
+    matched_df["wiki_title"] = matched_wiki["title"]
+    matched_df["wiki_usCite"] = matched_wiki["usCite"]
+    matched_df["wiki_docket"] = matched_wiki["docket"]
+    for col in ["views_all_time", "views_1yr", "views_6mo", "views_1mo"]:
+        matched_df[col] = matched_wiki[col]
+
+    unmatched_df = wiki[~is_matched]
 
     matched_df.to_csv(OUTPUT_FILE, index=False)
     unmatched_df.to_csv(UNMATCHED_FILE, index=False)
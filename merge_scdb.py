@@ -27,15 +27,18 @@ The script will produce:
     SCDB_merged.csv
 """
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 
+from csv_io import read_csv_as_strings
 
-def read_scdb_csv(path: str) -> pd.DataFrame:
+
+def read_scdb_csv(path: str) -> pa.Table:
     """Load SCDB CSVs, trying UTF-8 first then CP1252 fallback."""
     try:
-        return pd.read_csv(path, dtype=str, encoding="utf-8")
-    except UnicodeDecodeError:
-        return pd.read_csv(path, dtype=str, encoding="cp1252")
+        return read_csv_as_strings(path, "utf-8")
+    except (UnicodeDecodeError, pa.ArrowInvalid):
+        return read_csv_as_strings(path, "cp1252")
 
 
 def main():
@@ -57,11 +60,12 @@ def main():
     modern = read_scdb_csv(modern_file)
 
     print("Merging datasets...")
-    merged = pd.concat([legacy, modern], ignore_index=True)
+    # Columns missing from one release are filled with nulls
+    merged = pa.concat_tables([legacy, modern], promote_options="default")
 
     output = "SCDB_merged.csv"
     print(f"Saving merged SCDB to: {output}")
-    merged.to_csv(output, index=False)
+    pv.write_csv(merged, output)
 
     print("\nDone! SCDB_merged.csv is ready.")
 